@@ -1,9 +1,42 @@
-from typing import Union, Literal, Optional
+from typing import Union, Optional, Iterable, Callable
 from enum import IntEnum
 from datetime import datetime
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+import functools
+import operator
+import re
 import warnings
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+try:
+    from numba import njit, prange
+except ImportError:  # pragma: no cover
+    njit = None
+    prange = range
+
+
+# Set to False to silence the field overwrite warning in mutable mode.
+_WARN_OVERWRITE = True
+# Set to False to silence the warning emitted by and_dow()/and_dom().
+_EMIT_CONJ_WARN = True
+
+_WARNING_REGISTRY: dict = {}
+
+
+def _warn(message: str) -> None:
+    """Emit a UserWarning attributed to this module, without walking the stack."""
+    warnings.warn_explicit(
+        message, UserWarning, __file__, 0, module=__name__, registry=_WARNING_REGISTRY
+    )
+
+
+# Maps ``datetime.weekday()`` (Monday=0) to cron day of week (Sunday=0).
+_PY_WD_TO_CRON = (1, 2, 3, 4, 5, 6, 0)
+
 
 class Weekday(IntEnum):
     """Enum for weekday values in cron expressions."""
@@ -52,56 +85,215 @@ class Month(IntEnum):
     DEC = 12
 
 
-@dataclass(frozen=True)
+class Kind(IntEnum):
+    """Enum for the kind of a cron field expression."""
+    ANY = 0
+    VALUE = 1
+    LIST = 2
+    RANGE = 3
+    STEP = 4
+
+
+_KINDS: dict[Union[str, int], Kind] = {
+    **{kind.name.lower(): kind for kind in Kind},
+    **{kind: kind for kind in Kind},
+}
+
+# Index into the dispatch tables used for kinds not in ``Kind``.
+_UNKNOWN = len(Kind)
+
+
+def _match_any(expr: 'CronExpr', actual: int) -> bool:
+    return True
+
+
+def _match_value(expr: 'CronExpr', actual: int) -> bool:
+    return actual == expr.values[0]
+
+
+def _match_list(expr: 'CronExpr', actual: int) -> bool:
+    return actual in expr._lookup
+
+
+def _match_range(expr: 'CronExpr', actual: int) -> bool:
+    return expr.values[0] <= actual <= expr.values[1]
+
+
+def _match_step(expr: 'CronExpr', actual: int) -> bool:
+    start, step = expr.values
+    if start == -1:
+        return actual % step == 0
+    return actual >= start and (actual - start) % step == 0
+
+
+def _match_unknown(expr: 'CronExpr', actual: int) -> bool:
+    return False
+
+
+def _str_any(expr: 'CronExpr') -> str:
+    return "*"
+
+
+def _str_value(expr: 'CronExpr') -> str:
+    return str(expr.values[0])
+
+
+def _str_list(expr: 'CronExpr') -> str:
+    return ",".join(map(str, expr.values))
+
+
+def _str_range(expr: 'CronExpr') -> str:
+    return f"{expr.values[0]}-{expr.values[1]}"
+
+
+def _str_step(expr: 'CronExpr') -> str:
+    start, step = expr.values
+    if start == -1:
+        return f"*/{step}"
+    return f"{start}/{step}"
+
+
+def _mask_any(expr: 'CronExpr', min_val: int, max_val: int) -> int:
+    return ((1 << (max_val + 1)) - 1) & ~((1 << min_val) - 1)
+
+
+def _bit(v: int, min_val: int, max_val: int) -> int:
+    """Return the bit for ``v``, or 0 if it is not an int within the field's bounds."""
+    if isinstance(v, int) and min_val <= v <= max_val:
+        return 1 << v
+    return 0
+
+
+def _mask_value(expr: 'CronExpr', min_val: int, max_val: int) -> int:
+    return _bit(expr.values[0], min_val, max_val)
+
+
+def _mask_list(expr: 'CronExpr', min_val: int, max_val: int) -> int:
+    mask = 0
+    for v in expr.values:
+        mask |= _bit(v, min_val, max_val)
+    return mask
+
+
+def _mask_range(expr: 'CronExpr', min_val: int, max_val: int) -> int:
+    start, end = expr.values
+    if not (isinstance(start, int) and isinstance(end, int)):
+        return 0
+    start = max(start, min_val)
+    end = min(end, max_val)
+    if start > end:
+        return 0
+    return ((1 << (end + 1)) - 1) ^ ((1 << start) - 1)
+
+
+def _mask_step(expr: 'CronExpr', min_val: int, max_val: int) -> int:
+    start, step = expr.values
+    if not (isinstance(start, int) and isinstance(step, int)) or step <= 0:
+        return 0
+    first = 0 if start == -1 else start
+    if first < min_val:
+        # Advance to the first value of the sequence inside the field's bounds.
+        first += -((first - min_val) // step) * step
+    mask = 0
+    for v in range(first, max_val + 1, step):
+        mask |= 1 << v
+    return mask
+
+
+def _mask_unknown(expr: 'CronExpr', min_val: int, max_val: int) -> int:
+    return 0
+
+
+# Dispatch tables indexed by ``Kind``, with a trailing fallback for unknown kinds.
+_MATCHERS = (_match_any, _match_value, _match_list, _match_range, _match_step, _match_unknown)
+_STRINGIFIERS = (_str_any, _str_value, _str_list, _str_range, _str_step, _str_any)
+_MASKERS = (_mask_any, _mask_value, _mask_list, _mask_range, _mask_step, _mask_unknown)
+
+
+@dataclass(frozen=True, slots=True)
 class CronExpr:
-    """Structured representation of a cron field value."""
-    kind: Literal["any", "value", "list", "range", "step"]
+    """Structured representation of a cron field value.
+    
+    ``kind`` also accepts the legacy lowercase names (``"any"``, ``"value"``, ...),
+    which are normalized to ``Kind`` members.
+    """
+    kind: Kind
     values: tuple[int, ...]
+    _op: int = field(init=False, repr=False, compare=False)
+    _str: str = field(init=False, repr=False, compare=False)
+    _lookup: frozenset[int] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        kind = _KINDS.get(self.kind)
+        if kind is None:
+            object.__setattr__(self, "_op", _UNKNOWN)
+        else:
+            object.__setattr__(self, "kind", kind)
+            object.__setattr__(self, "_op", int(kind))
+        # Always set, so the slots-generated __getstate__ (pickle/copy) can read it.
+        object.__setattr__(
+            self, "_lookup", frozenset(self.values) if kind is Kind.LIST else frozenset()
+        )
+        object.__setattr__(self, "_str", _STRINGIFIERS[self._op](self))
     
     def matches(self, actual: int) -> bool:
         """Check if a value matches this expression."""
-        if self.kind == "any":
-            return True
-        elif self.kind == "value":
-            return actual == self.values[0]
-        elif self.kind == "list":
-            return actual in self.values
-        elif self.kind == "range":
-            return self.values[0] <= actual <= self.values[1]
-        elif self.kind == "step":
-            start, step = self.values
-            if start == -1:
-                return actual % step == 0
-            return actual >= start and (actual - start) % step == 0
-        return False
+        return _MATCHERS[self._op](self, actual)
     
     def to_cron_str(self) -> str:
         """Convert to cron syntax string."""
-        if self.kind == "any":
-            return "*"
-        elif self.kind == "value":
-            return str(self.values[0])
-        elif self.kind == "list":
-            return ",".join(map(str, self.values))
-        elif self.kind == "range":
-            return f"{self.values[0]}-{self.values[1]}"
-        elif self.kind == "step":
-            start, step = self.values
-            if start == -1:
-                return f"*/{step}"
-            return f"{start}/{step}"
-        return "*"
+        return self._str
+
+
+_ANY_EXPR = CronExpr(Kind.ANY, ())
+
+
+def _compile_mask(expr: CronExpr, min_val: int, max_val: int) -> int:
+    """Compile an expression into a bitmask where bit ``v`` is set if ``v`` matches."""
+    return _MASKERS[expr._op](expr, min_val, max_val)
 
 
 class CronField:
     """Represents a single cron field with validation."""
     
+    __slots__ = ("min_val", "max_val", "name", "_expr", "_mask", "__weakref__")
+    
+    # Immutable fields are instances of a generated subclass whose _apply copies,
+    # so the mutable/immutable choice is made by method lookup instead of a branch.
+    _is_immutable = False
+    _immutable_cls: type
+    
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        if not cls.__dict__.get("_is_immutable", False):
+            cls._immutable_cls = _make_immutable_variant(cls)
+    
+    def __new__(cls, min_val: int = 0, max_val: int = 0, name: str = "", immutable: bool = False):
+        if immutable and not cls._is_immutable:
+            cls = cls._immutable_cls
+        return object.__new__(cls)
+    
     def __init__(self, min_val: int, max_val: int, name: str, immutable: bool = False):
         self.min_val = min_val
         self.max_val = max_val
         self.name = name
-        self.immutable = immutable
-        self.expr = CronExpr("any", ())
+        self._expr = _ANY_EXPR
+        self._mask = _compile_mask(_ANY_EXPR, min_val, max_val)
+    
+    @property
+    def expr(self) -> CronExpr:
+        """The field's expression; assigning it recompiles the match mask."""
+        return self._expr
+    
+    @property
+    def immutable(self) -> bool:
+        """Whether setters return a new field instead of modifying this one."""
+        return self._is_immutable
+    
+    @expr.setter
+    def expr(self, expr: CronExpr) -> None:
+        self._expr = expr
+        self._mask = _compile_mask(expr, self.min_val, self.max_val)
     
     def _validate_value(self, val: int) -> None:
         """Validate a single value is within range."""
@@ -112,91 +304,324 @@ class CronField:
     
     def _warn_overwrite(self, new_expr: CronExpr) -> None:
         """Warn if overwriting non-wildcard value."""
-        if self.expr.kind != "any":
-            warnings.warn(
-                f"{self.name} field overwritten: '{self.expr.to_cron_str()}' -> '{new_expr.to_cron_str()}'",
-                UserWarning,
-                stacklevel=4
-            )
+        if not _WARN_OVERWRITE or self._expr.kind is Kind.ANY:
+            return
+        _warn(f"{self.name} field overwritten: '{self._expr._str}' -> '{new_expr._str}'")
+    
+    def _apply_immutable(self, expr: CronExpr) -> 'CronField':
+        """Apply expression to a new field, leaving this one untouched."""
+        new = object.__new__(type(self))
+        new.min_val = self.min_val
+        new.max_val = self.max_val
+        new.name = self.name
+        new._expr = expr
+        new._mask = _compile_mask(expr, self.min_val, self.max_val)
+        return new
     
-    def _apply(self, expr: CronExpr) -> 'CronField':
-        """Apply expression, returning new field if immutable."""
-        if self.immutable:
-            new_field = CronField(self.min_val, self.max_val, self.name, self.immutable)
-            new_field.expr = expr
-            return new_field
-        else:
-            self._warn_overwrite(expr)
-            self.expr = expr
-            return self
+    def _apply_mutable(self, expr: CronExpr) -> 'CronField':
+        """Apply expression in place."""
+        self._warn_overwrite(expr)
+        self._expr = expr
+        self._mask = _compile_mask(expr, self.min_val, self.max_val)
+        return self
+    
+    _apply = _apply_mutable
     
     def set_value(self, val: int) -> 'CronField':
         """Set a specific value."""
+        val = operator.index(val)
         self._validate_value(val)
-        return self._apply(CronExpr("value", (val,)))
+        return self._apply(CronExpr(Kind.VALUE, (val,)))
     
     def set_values(self, *values: int) -> 'CronField':
         """Set multiple specific values (comma-separated)."""
+        n = len(values)
+        if n == 1:
+            return self.set_value(values[0])
+        if n == 0:
+            raise ValueError(f"{self.name} requires at least one value")
+        values = tuple(map(operator.index, values))
+        mn, mx = self.min_val, self.max_val
         for val in values:
-            self._validate_value(val)
-        return self._apply(CronExpr("list", tuple(values)))
+            if not mn <= val <= mx:
+                self._validate_value(val)
+        return self._apply(CronExpr(Kind.LIST, values))
     
     def set_range(self, start: int, end: int) -> 'CronField':
         """Set a range of values."""
-        self._validate_value(start)
-        self._validate_value(end)
+        start = operator.index(start)
+        end = operator.index(end)
+        mn, mx = self.min_val, self.max_val
+        if not mn <= start <= mx:
+            self._validate_value(start)
+        if not mn <= end <= mx:
+            self._validate_value(end)
         if start > end:
             raise ValueError(f"Range start ({start}) must be <= end ({end})")
-        return self._apply(CronExpr("range", (start, end)))
+        return self._apply(CronExpr(Kind.RANGE, (start, end)))
     
     def set_interval(self, interval: int, start: int = -1) -> 'CronField':
         """Set an interval (step value). start=-1 means wildcard."""
+        interval = operator.index(interval)
+        start = operator.index(start)
         if interval <= 0:
             raise ValueError(f"Interval must be positive, got {interval}")
         if start != -1:
             self._validate_value(start)
-        return self._apply(CronExpr("step", (start, interval)))
+        return self._apply(CronExpr(Kind.STEP, (start, interval)))
     
     def set_any(self) -> 'CronField':
         """Set to any value (*)."""
-        return self._apply(CronExpr("any", ()))
+        return self._apply(_ANY_EXPR)
     
     def matches(self, actual: int) -> bool:
         """Check if a value matches this field's expression."""
-        return self.expr.matches(actual)
+        return actual >= 0 and bool((self._mask >> actual) & 1)
     
     def __str__(self) -> str:
-        return self.expr.to_cron_str()
+        return self._expr._str
+
+
+def _read_only_expr(self: CronField) -> CronExpr:
+    """The field's expression (read-only: immutable fields may be shared)."""
+    return self._expr
+
+
+def _make_immutable_variant(cls: type) -> type:
+    """Create the subclass of ``cls`` used for its ``immutable=True`` instances."""
+    return type(cls.__name__, (cls,), {
+        "__slots__": (),
+        "__module__": cls.__module__,
+        # Resolvable by pickle as ``<cls>._immutable_cls``.
+        "__qualname__": f"{cls.__qualname__}._immutable_cls",
+        "__doc__": f"Immutable {cls.__name__}; created via ``{cls.__name__}(..., immutable=True)``.",
+        "_is_immutable": True,
+        "_apply": cls._apply_immutable,
+        # Immutable fields (including the interned wildcards) are shared between
+        # builders, so their expression can't be replaced in place.
+        "expr": property(_read_only_expr),
+    })
+
+
+CronField._immutable_cls = _make_immutable_variant(CronField)
+
+
+# Interned wildcard fields shared by every fresh immutable builder.
+_MINUTE_ANY = CronField(0, 59, "minute", immutable=True)
+_HOUR_ANY = CronField(0, 23, "hour", immutable=True)
+_DOM_ANY = CronField(1, 31, "day_of_month", immutable=True)
+_MONTH_ANY = CronField(1, 12, "month", immutable=True)
+_DOW_ANY = CronField(0, 6, "day_of_week", immutable=True)
+
+
+def _fresh_field(template: CronField) -> CronField:
+    """Create a mutable copy of an interned wildcard field."""
+    new = object.__new__(CronField)
+    new.min_val = template.min_val
+    new.max_val = template.max_val
+    new.name = template.name
+    new._expr = template._expr
+    new._mask = template._mask
+    return new
+
+
+_CRON_RE = re.compile(
+    r"\s*(?P<minute>\S+)\s+(?P<hour>\S+)\s+(?P<day_of_month>\S+)"
+    r"\s+(?P<month>\S+)\s+(?P<day_of_week>\S+)\s*\Z",
+    re.ASCII,
+)
+_FIELD_RE = re.compile(
+    r"(?:(?P<any>\*)|\*/(?P<every>\d+)|(?P<start>\d+)/(?P<step>\d+)"
+    r"|(?P<lo>\d+)-(?P<hi>\d+)|(?P<list>\d+(?:,\d+)*))\Z",
+    re.ASCII,
+)
+_FIELD_NAMES = ("minute", "hour", "day_of_month", "month", "day_of_week")
+# Builder attributes the cached string / should_run function are derived from.
+_CACHE_INPUTS = frozenset((*_FIELD_NAMES, "_conjunction"))
+
+
+def _parse_field(cron_field: CronField, token: str) -> CronField:
+    """Parse a single cron field token and apply it to ``cron_field``."""
+    m = _FIELD_RE.match(token)
+    if m is None:
+        raise ValueError(f"Invalid {cron_field.name} field: {token!r}")
+    kind = m.lastgroup
+    if kind == "any":
+        return cron_field.set_any()
+    elif kind == "every":
+        return cron_field.set_interval(int(m["every"]))
+    elif kind == "step":
+        return cron_field.set_interval(int(m["step"]), int(m["start"]))
+    elif kind == "hi":
+        return cron_field.set_range(int(m["lo"]), int(m["hi"]))
+    return cron_field.set_values(*map(int, m["list"].split(",")))
+
+
+def _datetime64_components(times):
+    """Return (day_of_month, cron day_of_week) int64 arrays for a datetime64 array."""
+    days_since_epoch = times.astype("datetime64[D]")
+    month_start = days_since_epoch.astype("datetime64[M]").astype("datetime64[D]")
+    days = (days_since_epoch - month_start).astype(np.int64) + 1
+    # 1970-01-01 was a Thursday, which is 4 in cron numbering.
+    weekdays = (days_since_epoch.astype(np.int64) + 4) % 7
+    return days, weekdays
+
+
+def _should_run_kernel(dom_mask, dow_mask, days, weekdays, out):
+    """Evaluate a DOM/DOW conjunction for each (day, weekday) pair into ``out``."""
+    for i in prange(days.shape[0]):
+        out[i] = ((dom_mask >> days[i]) & (dow_mask >> weekdays[i]) & 1) == 1
+
+
+@functools.cache
+def _get_kernel():
+    """JIT-compile the batch kernel on first use, or return None without Numba."""
+    if njit is None:
+        return None
+    return njit(cache=True, parallel=True)(_should_run_kernel)
+
+
+def _value_mask(cron_field: CronField, value: int) -> int:
+    """Return the single-bit mask for ``value``, or 0 if it is outside the field's range."""
+    if cron_field.min_val <= value <= cron_field.max_val:
+        return 1 << value
+    return 0
+
+
+@functools.lru_cache(maxsize=1024)
+def _codegen_should_run(dom_mask: int, dow_mask: int) -> Callable[[datetime], bool]:
+    """Generate a ``should_run`` function with both conjunction masks inlined."""
+    source = (
+        "def should_run(dt):\n"
+        f"    return (({dom_mask:d} >> dt.day) & ({dow_mask:d} >> _PY_WD_TO_CRON[dt.weekday()]) & 1) == 1\n"
+    )
+    namespace = {"_PY_WD_TO_CRON": _PY_WD_TO_CRON}
+    exec(source, namespace)
+    return namespace["should_run"]
 
 
 class CronBuilder:
     """A fluent builder for cron expressions with validation."""
     
+    __slots__ = (
+        "immutable", "minute", "hour", "day_of_month", "month", "day_of_week",
+        "_conjunction", "_str_cache", "_should_run", "__weakref__",
+    )
+    
     def __init__(self, immutable: bool = False):
         """Create a CronBuilder."""
         self.immutable = immutable
-        self.minute = CronField(0, 59, "minute", immutable)
-        self.hour = CronField(0, 23, "hour", immutable)
-        self.day_of_month = CronField(1, 31, "day_of_month", immutable)
-        self.month = CronField(1, 12, "month", immutable)
-        self.day_of_week = CronField(0, 6, "day_of_week", immutable)
+        if immutable:
+            self.minute = _MINUTE_ANY
+            self.hour = _HOUR_ANY
+            self.day_of_month = _DOM_ANY
+            self.month = _MONTH_ANY
+            self.day_of_week = _DOW_ANY
+        else:
+            self.minute = _fresh_field(_MINUTE_ANY)
+            self.hour = _fresh_field(_HOUR_ANY)
+            self.day_of_month = _fresh_field(_DOM_ANY)
+            self.month = _fresh_field(_MONTH_ANY)
+            self.day_of_week = _fresh_field(_DOW_ANY)
         self._conjunction: Optional[tuple[str, int]] = None
+        self._str_cache: Optional[str] = None
+        self._should_run: Optional[Callable[[datetime], bool]] = None
+    
+    def __setattr__(self, name: str, value) -> None:
+        object.__setattr__(self, name, value)
+        if name in _CACHE_INPUTS:
+            object.__setattr__(self, "_str_cache", None)
+            object.__setattr__(self, "_should_run", None)
+    
+    def __getstate__(self) -> dict:
+        # The derived caches are rebuilt on demand; the exec-generated
+        # should_run function in particular cannot be pickled.
+        state = {
+            name: getattr(self, name)
+            for name in _BUILDER_STATE
+            if hasattr(self, name)
+        }
+        state["_str_cache"] = None
+        state["_should_run"] = None
+        return state
+    
+    def __setstate__(self, state: dict) -> None:
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+    
+    @classmethod
+    def from_cron_string(cls, expression: str, immutable: bool = False) -> 'CronBuilder':
+        """Parse a five-field cron string such as ``"0,30 9-17 * * 1-5"``."""
+        m = _CRON_RE.match(expression)
+        if m is None:
+            raise ValueError(f"Cron expression must have 5 fields, got {expression!r}")
+        new = cls(immutable)
+        for name in _FIELD_NAMES:
+            setattr(new, name, _parse_field(getattr(new, name), m[name]))
+        return new
+    
+    @classmethod
+    def _new_from(
+        cls,
+        immutable: bool,
+        minute: CronField,
+        hour: CronField,
+        day_of_month: CronField,
+        month: CronField,
+        day_of_week: CronField,
+        conjunction: Optional[tuple[str, int]],
+    ) -> 'CronBuilder':
+        """Create a builder from existing fields, bypassing ``__init__``."""
+        new = object.__new__(cls)
+        # Bypass __setattr__: the caches are initialized explicitly below.
+        set_ = object.__setattr__
+        set_(new, "immutable", immutable)
+        set_(new, "minute", minute)
+        set_(new, "hour", hour)
+        set_(new, "day_of_month", day_of_month)
+        set_(new, "month", month)
+        set_(new, "day_of_week", day_of_week)
+        set_(new, "_conjunction", conjunction)
+        set_(new, "_str_cache", None)
+        set_(new, "_should_run", None)
+        return new
     
-    def _copy_with(self, **fields) -> 'CronBuilder':
+    def _copy_with(
+        self,
+        minute: Optional[CronField] = None,
+        hour: Optional[CronField] = None,
+        day_of_month: Optional[CronField] = None,
+        month: Optional[CronField] = None,
+        day_of_week: Optional[CronField] = None,
+        conjunction: Optional[tuple[str, int]] = None,
+    ) -> 'CronBuilder':
         """Create a copy with updated fields (for immutable mode)."""
         if not self.immutable:
-            for name, field in fields.items():
-                setattr(self, name, field)
+            # Fields usually mutate in place, but a field's setter may return a
+            # new object (e.g. an immutable field assigned by the caller).
+            if minute is not None:
+                self.minute = minute
+            if hour is not None:
+                self.hour = hour
+            if day_of_month is not None:
+                self.day_of_month = day_of_month
+            if month is not None:
+                self.month = month
+            if day_of_week is not None:
+                self.day_of_week = day_of_week
+            if conjunction is not None:
+                self._conjunction = conjunction
             return self
         
-        new = CronBuilder(immutable=True)
-        new.minute = fields.get('minute', self.minute)
-        new.hour = fields.get('hour', self.hour)
-        new.day_of_month = fields.get('day_of_month', self.day_of_month)
-        new.month = fields.get('month', self.month)
-        new.day_of_week = fields.get('day_of_week', self.day_of_week)
-        new._conjunction = fields.get('_conjunction', self._conjunction)
-        return new
+        return self._new_from(
+            True,
+            minute if minute is not None else self.minute,
+            hour if hour is not None else self.hour,
+            day_of_month if day_of_month is not None else self.day_of_month,
+            month if month is not None else self.month,
+            day_of_week if day_of_week is not None else self.day_of_week,
+            conjunction if conjunction is not None else self._conjunction,
+        )
     
     def at_minute(self, minute: int) -> 'CronBuilder':
         return self._copy_with(minute=self.minute.set_value(minute))
@@ -240,25 +665,19 @@ class CronBuilder:
     day_of_month_range = dom_range
     
     def in_month(self, month: Union[int, Month]) -> 'CronBuilder':
-        month_val = month.value if isinstance(month, Month) else month
-        return self._copy_with(month=self.month.set_value(month_val))
+        return self._copy_with(month=self.month.set_value(month))
     
     def in_months(self, *months: Union[int, Month]) -> 'CronBuilder':
-        month_values = [m.value if isinstance(m, Month) else m for m in months]
-        return self._copy_with(month=self.month.set_values(*month_values))
+        return self._copy_with(month=self.month.set_values(*months))
     
     def month_range(self, start: Union[int, Month], end: Union[int, Month]) -> 'CronBuilder':
-        start_val = start.value if isinstance(start, Month) else start
-        end_val = end.value if isinstance(end, Month) else end
-        return self._copy_with(month=self.month.set_range(start_val, end_val))
+        return self._copy_with(month=self.month.set_range(start, end))
     
     def on_dow(self, day: Union[int, Weekday]) -> 'CronBuilder':
-        day_val = day.value if isinstance(day, Weekday) else day
-        return self._copy_with(day_of_week=self.day_of_week.set_value(day_val))
+        return self._copy_with(day_of_week=self.day_of_week.set_value(day))
     
     def on_dows(self, *days: Union[int, Weekday]) -> 'CronBuilder':
-        day_values = [d.value if isinstance(d, Weekday) else d for d in days]
-        return self._copy_with(day_of_week=self.day_of_week.set_values(*day_values))
+        return self._copy_with(day_of_week=self.day_of_week.set_values(*days))
     
     def on_weekdays(self) -> 'CronBuilder':
         return self._copy_with(day_of_week=self.day_of_week.set_range(1, 5))
@@ -267,9 +686,7 @@ class CronBuilder:
         return self._copy_with(day_of_week=self.day_of_week.set_values(0, 6))
     
     def dow_range(self, start: Union[int, Weekday], end: Union[int, Weekday]) -> 'CronBuilder':
-        start_val = start.value if isinstance(start, Weekday) else start
-        end_val = end.value if isinstance(end, Weekday) else end
-        return self._copy_with(day_of_week=self.day_of_week.set_range(start_val, end_val))
+        return self._copy_with(day_of_week=self.day_of_week.set_range(start, end))
     
     on_day = on_dow
     on_days = on_dows
@@ -291,62 +708,134 @@ class CronBuilder:
         return self.at(hour, minute).on_dom(day).in_month(month)
     
     def and_dow(self, day: Union[int, Weekday]) -> 'CronBuilder':
-        if self.day_of_month.expr.kind == "any":
+        if self.day_of_month.expr.kind is Kind.ANY:
             raise ValueError("Must set day_of_month before calling and_dow()")
         
-        day_val = day.value if isinstance(day, Weekday) else day
+        day_val = operator.index(day)
         
-        warnings.warn(
-            f"Conjunction created: DOM AND DOW={day_val}. "
-            f"Cron runs on DOM, use should_run() to validate both conditions.",
-            UserWarning,
-            stacklevel=2
-        )
+        if _EMIT_CONJ_WARN:
+            _warn(
+                f"Conjunction created: DOM AND DOW={day_val}. "
+                f"Cron runs on DOM, use should_run() to validate both conditions."
+            )
         
-        return self._copy_with(_conjunction=("dow", day_val))
+        return self._copy_with(conjunction=("dow", day_val))
     
     def and_dom(self, day: int) -> 'CronBuilder':
-        if self.day_of_week.expr.kind == "any":
+        if self.day_of_week.expr.kind is Kind.ANY:
             raise ValueError("Must set day_of_week before calling and_dom()")
         
-        warnings.warn(
-            f"Conjunction created: DOW AND DOM={day}. "
-            f"Cron runs on DOW, use should_run() to validate both conditions.",
-            UserWarning,
-            stacklevel=2
-        )
+        day_val = operator.index(day)
+        
+        if _EMIT_CONJ_WARN:
+            _warn(
+                f"Conjunction created: DOW AND DOM={day_val}. "
+                f"Cron runs on DOW, use should_run() to validate both conditions."
+            )
         
-        return self._copy_with(_conjunction=("dom", day))
+        return self._copy_with(conjunction=("dom", day_val))
     
     and_day = and_dow
     and_day_of_month = and_dom
     
+    def _conjunction_masks(self) -> tuple[int, int]:
+        """Return the (day_of_month, day_of_week) masks the conjunction requires."""
+        conj_type, conj_value = self._conjunction
+        if conj_type == "dow":
+            return self.day_of_month._mask, _value_mask(self.day_of_week, conj_value)
+        return _value_mask(self.day_of_month, conj_value), self.day_of_week._mask
+    
     def should_run(self, check_time: Optional[datetime] = None) -> bool:
-        if self._conjunction is None:
+        conj = self._conjunction
+        if conj is None:
             return True
         
+        if self.immutable:
+            # Immutable builders never change, so specialize once and reuse.
+            fn = self._should_run
+            if fn is None:
+                fn = self._should_run = _codegen_should_run(*self._conjunction_masks())
+            return fn(check_time or datetime.now())
+        
         dt = check_time or datetime.now()
-        conj_type, conj_value = self._conjunction
+        conj_type, conj_value = conj
         
-        dt_weekday = (dt.weekday() + 1) % 7
+        dt_day = dt.day
+        dt_weekday = _PY_WD_TO_CRON[dt.weekday()]
         
         if conj_type == "dow":
-            if not self.day_of_month.matches(dt.day):
+            if not self.day_of_month.matches(dt_day):
                 return False
             return dt_weekday == conj_value
         else:
             if not self.day_of_week.matches(dt_weekday):
                 return False
-            return dt.day == conj_value
+            return dt_day == conj_value
+    
+    def should_run_many(self, check_times: Iterable[datetime]):
+        """Vectorized ``should_run`` over many datetimes.
+        
+        Accepts an iterable of ``datetime`` objects or a NumPy ``datetime64``
+        array (of any shape; the result has the same shape). Returns a boolean
+        NumPy array when NumPy is installed (JIT-compiled with Numba when
+        available), otherwise a list of bools.
+        """
+        is_dt64 = np is not None and isinstance(check_times, np.ndarray) and check_times.dtype.kind == "M"
+        if is_dt64:
+            shape = check_times.shape
+            times = check_times.ravel()
+        else:
+            times = list(check_times)
+            shape = (len(times),)
+        if self._conjunction is None:
+            return np.ones(shape, dtype=bool) if np is not None else [True] * len(times)
+        
+        dom_mask, dow_mask = self._conjunction_masks()
+        if is_dt64:
+            days_arr, weekdays_arr = _datetime64_components(times)
+        else:
+            days = [dt.day for dt in times]
+            weekdays = [_PY_WD_TO_CRON[dt.weekday()] for dt in times]
+            if np is None:
+                return [
+                    ((dom_mask >> d) & (dow_mask >> w) & 1) == 1
+                    for d, w in zip(days, weekdays)
+                ]
+            days_arr = np.array(days, dtype=np.int64)
+            weekdays_arr = np.array(weekdays, dtype=np.int64)
+        
+        kernel = _get_kernel()
+        if kernel is None:
+            out = ((dom_mask >> days_arr) & (dow_mask >> weekdays_arr) & 1) == 1
+        else:
+            out = np.empty(len(days_arr), dtype=bool)
+            kernel(dom_mask, dow_mask, days_arr, weekdays_arr, out)
+        return out.reshape(shape)
     
     def __call__(self, check_time: Optional[datetime] = None) -> bool:
         return self.should_run(check_time)
     
     def __str__(self) -> str:
-        return f"{self.minute} {self.hour} {self.day_of_month} {self.month} {self.day_of_week}"
+        cached = self._str_cache
+        if cached is None:
+            cached = " ".join((
+                self.minute._expr._str,
+                self.hour._expr._str,
+                self.day_of_month._expr._str,
+                self.month._expr._str,
+                self.day_of_week._expr._str,
+            ))
+            # Mutable fields can change through their own setters, so only
+            # immutable builders keep the rendered string.
+            if self.immutable:
+                self._str_cache = cached
+        return cached
     
     def __repr__(self) -> str:
         return f"CronBuilder('{str(self)}')"
 
 
-__all__ = ["CronBuilder", "CronExpr", "CronField", "Weekday", "Month"]
+_BUILDER_STATE = tuple(name for name in CronBuilder.__slots__ if name != "__weakref__")
+
+
+__all__ = ["CronBuilder", "CronExpr", "CronField", "Kind", "Weekday", "Month"]
@@ -1,7 +1,12 @@
+import copy
+import gc
+import pickle
+import weakref
 import pytest
 import warnings
-from datetime import datetime
-from cron_builder import CronBuilder, CronExpr, CronField, Weekday, Month
+from datetime import datetime, timedelta
+import cron_builder
+from cron_builder import CronBuilder, CronExpr, CronField, Kind, Weekday, Month
 
 
 class TestImmutableMode:
@@ -25,6 +30,117 @@ class TestImmutableMode:
         assert str(b1.hour) == "9"
         assert str(b2.hour) == "14"
     
+    def test_mutable_str_cache_invalidated(self):
+        b = CronBuilder(immutable=False)
+        assert str(b) == "* * * * *"
+        b.at_hour(9)
+        assert str(b) == "* 9 * * *"
+        b.on_dom(1)
+        assert str(b) == "* 9 1 * *"
+    
+    def test_mutable_str_tracks_direct_field_changes(self):
+        b = CronBuilder(immutable=False)
+        assert str(b) == "* * * * *"
+        b.minute.set_value(5)
+        assert str(b) == "5 * * * *"
+        b.hour = CronField(0, 23, "hour").set_value(9)
+        assert str(b) == "5 9 * * *"
+    
+    def test_mutable_builder_with_immutable_field(self):
+        b = CronBuilder()
+        b.minute = CronField(0, 59, "minute", immutable=True)
+        b.at_minute(5)
+        assert str(b) == "5 * * * *"
+    
+    def test_immutable_caches_reset_on_field_assignment(self):
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            b = CronBuilder(immutable=True).on_dom(1).and_dow(Weekday.MONDAY)
+        assert str(b) == "* * 1 * *"
+        assert b.should_run(datetime(2024, 1, 1)) is True  # Monday 1st
+        b.day_of_month = b.day_of_month.set_value(8)
+        assert str(b) == "* * 8 * *"
+        assert b.should_run(datetime(2024, 1, 1)) is False
+        assert b.should_run(datetime(2024, 1, 8)) is True  # Monday 8th
+        b._conjunction = ("dow", 2)
+        assert b.should_run(datetime(2024, 1, 8)) is False
+    
+    def test_immutable_str_cache_per_instance(self):
+        b = CronBuilder(immutable=True)
+        assert str(b) == "* * * * *"
+        b1 = b.at_hour(9)
+        assert str(b1) == "* 9 * * *"
+        assert str(b) == "* * * * *"
+    
+    def test_immutable_copy_preserves_conjunction(self):
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            b = CronBuilder(immutable=True).on_dom(1).and_dow(Weekday.MONDAY)
+        b1 = b.at(9, 30)
+        assert b1._conjunction == ("dow", 1)
+        assert str(b1) == "30 9 1 * *"
+        assert b1.day_of_month is b.day_of_month
+    
+    def test_mutable_overwrite_warns(self):
+        b = CronBuilder(immutable=False).at_hour(9)
+        with pytest.warns(UserWarning, match="hour field overwritten: '9' -> '14'"):
+            b.at_hour(14)
+    
+    def test_mutable_overwrite_warning_disabled(self, monkeypatch):
+        monkeypatch.setattr(cron_builder, "_WARN_OVERWRITE", False)
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            CronBuilder(immutable=False).at_hour(9).at_hour(14)
+    
+    def test_immutable_builders_share_wildcard_fields(self):
+        b1 = CronBuilder(immutable=True)
+        b2 = CronBuilder(immutable=True)
+        assert b1.minute is b2.minute
+        b1.at_minute(5)
+        assert str(b2.minute) == "*"
+    
+    def test_mutable_builders_get_own_fields(self):
+        b1 = CronBuilder(immutable=False)
+        b2 = CronBuilder(immutable=False)
+        assert b1.minute is not b2.minute
+        b1.at_minute(5)
+        assert str(b2.minute) == "*"
+        assert not b1.minute.immutable
+    
+    @pytest.mark.parametrize("immutable", [False, True])
+    def test_builder_pickle_and_copy_round_trip(self, immutable):
+        b = CronBuilder(immutable=immutable).at(9, 30).on_doms(1, 15)
+        for clone in (pickle.loads(pickle.dumps(b)), copy.copy(b), copy.deepcopy(b)):
+            assert str(clone) == "30 9 1,15 * *"
+            assert clone.day_of_month.matches(15)
+    
+    @pytest.mark.parametrize("immutable", [False, True])
+    def test_builder_with_conjunction_pickles_after_should_run(self, immutable):
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            b = CronBuilder(immutable=immutable).on_dom(1).and_dow(Weekday.MONDAY)
+        assert b.should_run(datetime(2024, 1, 1)) is True
+        str(b)
+        for clone in (pickle.loads(pickle.dumps(b)), copy.copy(b), copy.deepcopy(b)):
+            assert clone._conjunction == ("dow", 1)
+            assert clone.should_run(datetime(2024, 1, 1)) is True
+            assert clone.should_run(datetime(2025, 1, 1)) is False
+            assert str(clone) == "* * 1 * *"
+    
+    def test_no_instance_dict(self):
+        for b in (CronBuilder(), CronBuilder(immutable=True).at(9, 0)):
+            assert not hasattr(b, "__dict__")
+            assert not hasattr(b.minute, "__dict__")
+    
+    def test_weak_references(self):
+        registry = weakref.WeakValueDictionary()
+        b = CronBuilder(immutable=True).at(9, 0)
+        registry["tenant"] = b
+        assert registry["tenant"] is b
+        assert weakref.ref(b.minute)() is b.minute
+        mutable = CronBuilder()
+        assert weakref.ref(mutable)() is mutable
+    
     def test_immutable_no_warnings(self):
         with warnings.catch_warnings(record=True) as w:
             warnings.simplefilter("always")
@@ -75,6 +191,162 @@ class TestCronExpr:
         assert expr.matches(35)
         assert not expr.matches(0)
         assert not expr.matches(10)
+    
+    def test_legacy_kind_names_normalized(self):
+        assert CronExpr("range", (1, 5)).kind is Kind.RANGE
+        assert CronExpr("list", (1, 5)) == CronExpr(Kind.LIST, (1, 5))
+    
+    def test_slots_and_frozen(self):
+        expr = CronExpr(Kind.VALUE, (5,))
+        assert not hasattr(expr, "__dict__")
+        with pytest.raises(AttributeError):
+            expr.kind = Kind.ANY
+        assert hash(expr) == hash(CronExpr("value", (5,)))
+    
+    @pytest.mark.parametrize("expr", [
+        CronExpr(Kind.ANY, ()),
+        CronExpr(Kind.VALUE, (1,)),
+        CronExpr(Kind.LIST, (0, 30)),
+        CronExpr(Kind.RANGE, (1, 5)),
+        CronExpr(Kind.STEP, (-1, 15)),
+        CronExpr("invalid", ()),
+    ])
+    def test_pickle_and_copy_round_trip(self, expr):
+        for clone in (pickle.loads(pickle.dumps(expr)), copy.copy(expr), copy.deepcopy(expr)):
+            assert clone == expr
+            assert clone.to_cron_str() == expr.to_cron_str()
+            assert all(clone.matches(v) == expr.matches(v) for v in range(60))
+    
+    def test_kind_enum_construction(self):
+        expr = CronExpr(Kind.LIST, (0, 15, 30, 45))
+        assert expr.matches(15)
+        assert not expr.matches(16)
+        assert expr.to_cron_str() == "0,15,30,45"
+
+
+class _MinuteField(CronField):
+    __slots__ = ()
+
+
+class TestCronFieldMask:
+    """Test the precompiled CronField bitmask."""
+    
+    def test_mask_agrees_with_expr(self):
+        field = CronField(0, 59, "minute")
+        exprs = [
+            lambda f: f.set_any(),
+            lambda f: f.set_value(30),
+            lambda f: f.set_values(0, 15, 45),
+            lambda f: f.set_range(10, 20),
+            lambda f: f.set_interval(15),
+            lambda f: f.set_interval(15, start=5),
+        ]
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            for apply in exprs:
+                apply(field)
+                for v in range(60):
+                    assert field.matches(v) == field.expr.matches(v)
+    
+    @pytest.mark.parametrize("min_val,max_val", [(0, 59), (1, 31)])
+    @pytest.mark.parametrize("expr", [
+        CronExpr(Kind.RANGE, (5, 2)),
+        CronExpr(Kind.RANGE, (-3, 100)),
+        CronExpr(Kind.VALUE, (-1,)),
+        CronExpr(Kind.VALUE, (75,)),
+        CronExpr(Kind.LIST, (-2, 0, 5, 90)),
+        CronExpr(Kind.STEP, (-1, 5)),
+        CronExpr(Kind.STEP, (-7, 5)),
+        CronExpr(Kind.STEP, (40, 7)),
+        CronExpr("invalid", ()),
+    ])
+    def test_mask_agrees_with_assigned_expr(self, expr, min_val, max_val):
+        field = CronField(min_val, max_val, "test")
+        field.expr = expr
+        for v in range(min_val, max_val + 1):
+            assert field.matches(v) == expr.matches(v)
+        assert field._mask >> (max_val + 1) == 0
+        assert field._mask & ((1 << min_val) - 1) == 0
+    
+    def test_any_mask_respects_min_val(self):
+        field = CronField(1, 31, "day_of_month")
+        assert not field.matches(0)
+        assert field.matches(1)
+        assert field.matches(31)
+    
+    def test_negative_never_matches(self):
+        field = CronField(0, 59, "minute")
+        assert field.matches(-1) is False
+        field.set_range(0, 10)
+        assert field.matches(-5) is False
+    
+    def test_expr_assignment_recompiles_mask(self):
+        field = CronField(0, 59, "minute")
+        field.expr = CronExpr(Kind.VALUE, (7,))
+        assert field.matches(7)
+        assert not field.matches(8)
+        assert str(field) == "7"
+    
+    def test_immutable_field_chain(self):
+        field = CronField(0, 59, "minute", immutable=True)
+        first = field.set_value(1)
+        second = first.set_value(2)
+        assert (str(field), str(first), str(second)) == ("*", "1", "2")
+        assert second.immutable
+    
+    @pytest.mark.parametrize("immutable", [False, True])
+    def test_fields_create_no_reference_cycles(self, immutable):
+        gc.collect()
+        gc.disable()
+        try:
+            for _ in range(100):
+                CronBuilder(immutable=immutable).at(9, 30).on_weekdays()
+            assert gc.collect() == 0
+        finally:
+            gc.enable()
+    
+    def test_immutable_field_is_cron_field(self):
+        field = CronField(0, 59, "minute", immutable=True)
+        assert isinstance(field, CronField)
+        assert isinstance(field.set_value(1), CronField)
+        assert pickle.loads(pickle.dumps(field.set_value(1))).set_value(2).immutable
+    
+    def test_immutable_expr_is_read_only(self):
+        b = CronBuilder(immutable=True)
+        with pytest.raises(AttributeError):
+            b.minute.expr = CronExpr(Kind.VALUE, (5,))
+        assert str(CronBuilder(immutable=True)) == "* * * * *"
+        assert b.hour.set_value(9).expr == CronExpr(Kind.VALUE, (9,))
+    
+    def test_immutable_flag_is_read_only(self):
+        field = CronField(0, 59, "minute", immutable=True)
+        with pytest.raises(AttributeError):
+            field.immutable = False
+        assert field.set_value(1) is not field
+    
+    def test_immutable_user_subclass(self):
+        field = _MinuteField(0, 59, "minute", immutable=True)
+        new_field = field.set_value(3)
+        assert new_field is not field
+        assert str(field) == "*"
+        assert str(new_field) == "3"
+        assert isinstance(new_field, _MinuteField)
+        assert new_field.immutable
+        clone = pickle.loads(pickle.dumps(new_field))
+        assert type(clone) is type(new_field)
+        assert clone.set_value(4) is not clone
+    
+    def test_mutable_user_subclass(self):
+        field = _MinuteField(0, 59, "minute")
+        assert field.set_value(3) is field
+        assert not field.immutable
+    
+    def test_immutable_field_mask(self):
+        field = CronField(0, 23, "hour", immutable=True)
+        new_field = field.set_range(9, 17)
+        assert field.matches(3)
+        assert not new_field.matches(3)
+        assert new_field.matches(9)
 
 
 class TestCronBuilder:
@@ -186,6 +458,18 @@ class TestValidationErrors:
         with pytest.raises(ValueError, match="day_of_week must be between 0 and 6"):
             CronBuilder().on_dow(7)
     
+    def test_values_out_of_range(self):
+        with pytest.raises(ValueError, match="minute must be between 0 and 59, got 60"):
+            CronBuilder().at_minutes(0, 30, 60)
+    
+    def test_values_empty(self):
+        with pytest.raises(ValueError, match="minute requires at least one value"):
+            CronBuilder().at_minutes()
+    
+    def test_range_end_out_of_range(self):
+        with pytest.raises(ValueError, match="hour must be between 0 and 23, got 24"):
+            CronBuilder().hour_range(9, 24)
+    
     def test_range_validation_start_greater_than_end(self):
         with pytest.raises(ValueError, match="Range start .* must be <= end"):
             CronBuilder().minute_range(30, 15)
@@ -272,6 +556,37 @@ class TestAllMethods:
         cron = CronBuilder().on_dows(Weekday.MONDAY, Weekday.WEDNESDAY, Weekday.FRIDAY)
         assert str(cron.day_of_week) == "1,3,5"
     
+    def test_enum_values_stored_as_ints(self):
+        cron = CronBuilder().on_dows(Weekday.MONDAY, Weekday.FRIDAY).in_month(Month.JUNE)
+        assert all(type(v) is int for v in cron.day_of_week.expr.values)
+        assert type(cron.month.expr.values[0]) is int
+    
+    def test_single_value_list_is_value(self):
+        cron = CronBuilder().at_minutes(15)
+        assert cron.minute.expr == CronExpr(Kind.VALUE, (15,))
+        assert str(cron.minute) == "15"
+    
+    @pytest.mark.parametrize("bad", [2.7, "3"])
+    def test_enum_methods_reject_non_integers(self, bad):
+        with pytest.raises(TypeError):
+            CronBuilder().in_month(bad)
+        with pytest.raises(TypeError):
+            CronBuilder().on_dows(1, bad)
+        with pytest.raises(TypeError):
+            CronBuilder().on_dom(1).and_dow(bad)
+    
+    @pytest.mark.parametrize("build", [
+        lambda: CronBuilder().at_minute(2.7),
+        lambda: CronBuilder().at_minute("3"),
+        lambda: CronBuilder().at_minutes(0, 2.5),
+        lambda: CronBuilder().hour_range(9.0, 17),
+        lambda: CronBuilder().every_minutes(1.5),
+        lambda: CronField(0, 59, "minute").set_interval(15, start=5.0),
+    ])
+    def test_int_setters_reject_non_integers(self, build):
+        with pytest.raises(TypeError):
+            build()
+    
     def test_on_dows_with_ints(self):
         cron = CronBuilder().on_dows(1, 3, 5)
         assert str(cron.day_of_week) == "1,3,5"
@@ -383,9 +698,173 @@ class TestAllMethods:
         assert cron._conjunction == ("dom", 1)
 
 
+class TestFromCronString:
+    """Test parsing cron strings into builders."""
+    
+    @pytest.mark.parametrize("expression", [
+        "* * * * *",
+        "*/15 * * * *",
+        "0,30 9-17 * * 1-5",
+        "5/10 0 1 1,4,7,10 0",
+        "0 8 25 12 *",
+    ])
+    def test_round_trip(self, expression):
+        assert str(CronBuilder.from_cron_string(expression)) == expression
+    
+    def test_parsed_kinds(self):
+        cron = CronBuilder.from_cron_string("0,30 9-17 */2 5/3 1")
+        assert cron.minute.expr == CronExpr(Kind.LIST, (0, 30))
+        assert cron.hour.expr == CronExpr(Kind.RANGE, (9, 17))
+        assert cron.day_of_month.expr == CronExpr(Kind.STEP, (-1, 2))
+        assert cron.month.expr == CronExpr(Kind.STEP, (5, 3))
+        assert cron.day_of_week.expr == CronExpr(Kind.VALUE, (1,))
+    
+    def test_immutable(self):
+        cron = CronBuilder.from_cron_string("0 9 * * *", immutable=True)
+        later = cron.at_hour(17)
+        assert str(cron) == "0 9 * * *"
+        assert str(later) == "0 17 * * *"
+    
+    def test_wrong_field_count(self):
+        with pytest.raises(ValueError, match="must have 5 fields"):
+            CronBuilder.from_cron_string("* * * *")
+    
+    def test_invalid_token(self):
+        with pytest.raises(ValueError, match="Invalid hour field"):
+            CronBuilder.from_cron_string("0 9-x * * *")
+    
+    def test_non_ascii_digits_rejected(self):
+        with pytest.raises(ValueError, match="Invalid minute field"):
+            CronBuilder.from_cron_string("\u0663 * * * *")
+    
+    def test_out_of_range(self):
+        with pytest.raises(ValueError, match="day_of_week must be between 0 and 6"):
+            CronBuilder.from_cron_string("0 0 * * 7")
+
+
+class TestShouldRunMany:
+    """Test batch evaluation of should_run."""
+    
+    TIMES = [datetime(2024, 1, 1) + timedelta(days=i) for i in range(60)]
+    
+    @pytest.fixture(params=["default", "numpy", "python"])
+    def backend(self, request, monkeypatch):
+        if request.param != "default":
+            monkeypatch.setattr(cron_builder, "_get_kernel", lambda: None)
+        if request.param == "python":
+            monkeypatch.setattr(cron_builder, "np", None)
+        return request.param
+    
+    def test_no_conjunction(self, backend):
+        cron = CronBuilder().at(9, 0)
+        assert list(cron.should_run_many(self.TIMES)) == [True] * len(self.TIMES)
+    
+    def test_and_dow_matches_should_run(self, backend):
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            cron = CronBuilder().dom_range(1, 7).and_dow(Weekday.MONDAY)
+        expected = [cron.should_run(t) for t in self.TIMES]
+        assert list(cron.should_run_many(self.TIMES)) == expected
+        assert sum(expected) == 2
+    
+    def test_and_dom_matches_should_run(self, backend):
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            cron = CronBuilder().on_weekends().and_dom(7)
+        expected = [cron.should_run(t) for t in self.TIMES]
+        assert list(cron.should_run_many(self.TIMES)) == expected
+        assert sum(expected) == 1
+    
+    def test_datetime64_array(self, backend):
+        if backend == "python":
+            pytest.skip("datetime64 input requires NumPy")
+        np = pytest.importorskip("numpy")
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            cron = CronBuilder().dom_range(1, 7).and_dow(Weekday.MONDAY)
+        times = np.arange("1969-12-01T09:30", "2024-03-01", np.timedelta64(1, "D"), dtype="datetime64[m]")
+        expected = [cron.should_run(t) for t in times.astype(datetime)]
+        assert cron.should_run_many(times).tolist() == expected
+    
+    def test_datetime64_2d_array(self, backend):
+        if backend == "python":
+            pytest.skip("datetime64 input requires NumPy")
+        np = pytest.importorskip("numpy")
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            cron = CronBuilder().dom_range(1, 7).and_dow(Weekday.MONDAY)
+        times = np.arange("2024-01-01", "2024-03-01", dtype="datetime64[D]").reshape(4, -1)
+        result = cron.should_run_many(times)
+        assert result.shape == times.shape
+        assert result.ravel().tolist() == [cron.should_run(t) for t in times.ravel().astype(datetime)]
+        assert CronBuilder().should_run_many(times).shape == times.shape
+    
+    def test_out_of_range_conjunction(self, backend):
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            crons = [
+                CronBuilder().on_dow(1).and_dom(100),
+                CronBuilder().on_dow(1).and_dom(-1),
+                CronBuilder().on_dom(1).and_dow(-1),
+            ]
+        for cron in crons:
+            assert list(cron.should_run_many(self.TIMES)) == [False] * len(self.TIMES)
+
+
 class TestConjunctionEdgeCases:
     """Test conjunction edge cases."""
     
+    def test_conjunction_warns(self):
+        with pytest.warns(UserWarning, match="Conjunction created: DOM AND DOW=1"):
+            CronBuilder().on_dom(1).and_dow(Weekday.MONDAY)
+        with pytest.warns(UserWarning, match="Conjunction created: DOW AND DOM=1"):
+            CronBuilder().on_dow(Weekday.MONDAY).and_dom(1)
+    
+    def test_conjunction_warning_disabled(self, monkeypatch):
+        monkeypatch.setattr(cron_builder, "_EMIT_CONJ_WARN", False)
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            CronBuilder().on_dom(1).and_dow(Weekday.MONDAY)
+            CronBuilder().on_dow(Weekday.MONDAY).and_dom(1)
+    
+    def test_immutable_should_run_matches_mutable(self):
+        times = [datetime(2024, 1, 1) + timedelta(days=i) for i in range(60)]
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            for immutable_cron, mutable_cron in [
+                (CronBuilder(immutable=True).dom_range(1, 7).and_dow(Weekday.MONDAY),
+                 CronBuilder().dom_range(1, 7).and_dow(Weekday.MONDAY)),
+                (CronBuilder(immutable=True).on_weekdays().and_dom(15),
+                 CronBuilder().on_weekdays().and_dom(15)),
+            ]:
+                for t in times:
+                    assert immutable_cron.should_run(t) is mutable_cron.should_run(t)
+    
+    @pytest.mark.parametrize("immutable", [False, True])
+    @pytest.mark.parametrize("bad", [2.0, "2"])
+    def test_and_dom_rejects_non_integers(self, immutable, bad):
+        with pytest.raises(TypeError):
+            CronBuilder(immutable=immutable).on_dow(Weekday.FRIDAY).and_dom(bad)
+    
+    @pytest.mark.parametrize("immutable", [False, True])
+    def test_out_of_range_conjunction_never_runs(self, immutable):
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            and_dow = CronBuilder(immutable=immutable).on_dom(1).and_dow(-1)
+            and_dom = CronBuilder(immutable=immutable).on_dow(1).and_dom(100)
+        assert and_dow.should_run(datetime(2024, 1, 1)) is False
+        assert and_dom.should_run(datetime(2024, 1, 1)) is False
+    
+    def test_immutable_should_run_specialized_once(self):
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            cron = CronBuilder(immutable=True).on_dom(1).and_dow(Weekday.MONDAY)
+        assert cron.should_run(datetime(2024, 1, 1)) is True
+        fn = cron._should_run
+        assert fn is not None
+        assert cron.should_run(datetime(2025, 1, 1)) is False
+        assert cron._should_run is fn
+    
     def test_and_dom_with_int_dow(self):
         with warnings.catch_warnings():
             warnings.simplefilter("ignore")
@@ -394,6 +873,14 @@ class TestConjunctionEdgeCases:
         assert cron.should_run(datetime(2024, 1, 15)) is True  # Monday Jan 15
         assert cron.should_run(datetime(2024, 1, 8)) is False  # Monday but not 15th
     
+    def test_and_dom_sunday(self):
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            cron = CronBuilder().on_dow(Weekday.SUNDAY).and_dom(7)
+        assert cron.should_run(datetime(2024, 1, 7)) is True  # Sunday Jan 7
+        assert cron.should_run(datetime(2024, 4, 7)) is True  # Sunday Apr 7
+        assert cron.should_run(datetime(2024, 2, 7)) is False  # Wednesday
+    
     def test_should_run_dow_mismatch_in_and_dom(self):
         with warnings.catch_warnings():
             warnings.simplefilter("ignore")